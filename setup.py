@@ -11,6 +11,8 @@ setup(
     classifiers=["Programming Language :: Python :: 3 :: Only"],
     py_modules=["tap_salesforce"],
     install_requires=[
+        "ciso8601",
+        "orjson>=3",
         "requests==2.32.2",
         "singer-python~=5.13",
         "xmltodict==0.11.0",
@@ -141,13 +141,18 @@ def do_discover(sf: Salesforce, streams: list[str]):  # noqa: C901
     sf_custom_setting_objects = []
     object_to_tag_references = {}
 
+    # The blacklist is derived from static sets per api_type; build it once
+    # rather than re-unioning the sets for every object
+    blacklisted_objects = sf.get_blacklisted_objects()
+    blacklisted_fields = sf.get_blacklisted_fields()
+
     # Build batches of SF sbjects. 25 per batch.
     sobject_batches = []
     batch = []
     for sobject_name in objects_to_discover:
         # Skip blacklisted SF objects depending on the api_type in use
         # ChangeEvent objects are not queryable via Bulk or REST (undocumented)
-        if sobject_name in sf.get_blacklisted_objects() or sobject_name.endswith("ChangeEvent"):
+        if sobject_name in blacklisted_objects or sobject_name.endswith("ChangeEvent"):
             continue
 
         batch.append(sobject_name)
@@ -191,8 +196,10 @@ def do_discover(sf: Salesforce, streams: list[str]):  # noqa: C901
 
             # Loop over the object's fields
             for f in fields:
-                field_name = f["name"]
-                field_type = f["type"]  # noqa: F841
+                # Standard field names (Id, CreatedDate, SystemModstamp, ...)
+                # recur across hundreds of objects; interning shares one str
+                # per name across all the schema and metadata dicts built below
+                field_name = sys.intern(f["name"])
 
                 if field_name == "Id":
                     found_id_field = True
@@ -218,8 +225,8 @@ def do_discover(sf: Salesforce, streams: list[str]):  # noqa: C901
 
                 # Blacklisted fields are dependent on the api_type being used
                 field_pair = (sobject_name, field_name)
-                if field_pair in sf.get_blacklisted_fields():
-                    unsupported_fields.add((field_name, sf.get_blacklisted_fields()[field_pair]))
+                if field_pair in blacklisted_fields:
+                    unsupported_fields.add((field_name, blacklisted_fields[field_pair]))
 
                 inclusion = metadata.get(mdata, ("properties", field_name), "inclusion")
 
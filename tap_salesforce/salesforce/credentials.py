@@ -2,6 +2,7 @@ import logging
 import threading
 from collections import namedtuple
 
+import orjson
 import requests
 from simple_salesforce import SalesforceLogin
 
@@ -12,12 +13,13 @@ OAuthCredentials = namedtuple("OAuthCredentials", ("client_id", "client_secret",
 
 PasswordCredentials = namedtuple("PasswordCredentials", ("username", "password", "security_token"))
 
+CREDENTIAL_CLASSES = (PasswordCredentials, OAuthCredentials)
+
 
 def parse_credentials(config):
-    for cls in reversed((OAuthCredentials, PasswordCredentials)):
-        creds = cls(*(config.get(key) for key in cls._fields))
-        if all(creds):
-            return creds
+    for cls in CREDENTIAL_CLASSES:
+        if all(config.get(key) for key in cls._fields):
+            return cls(*(config.get(key) for key in cls._fields))
 
     raise Exception("Cannot create credentials from config.")
 
@@ -30,13 +32,23 @@ class SalesforceAuth:
         self._instance_url = None
         self._auth_header = None
         self.login_timer = None
+        self._rest_headers = None
+        self._rest_headers_token = None
+        # Reused across token refreshes to keep the login connection alive
+        self._session = requests.Session()
 
     def login(self):
         """Attempt to login and set the `instance_url` and `access_token` on success."""
 
     @property
     def rest_headers(self):
-        return {"Authorization": f"Bearer {self._access_token}"}
+        # Accessed on every request; only rebuilt when the token rotates.
+        # Callers must not mutate the returned dict.
+        if self._rest_headers is None or self._rest_headers_token != self._access_token:
+            self._rest_headers = {"Authorization": f"Bearer {self._access_token}"}
+            self._rest_headers_token = self._access_token
+
+        return self._rest_headers
 
     @property
     def bulk_headers(self):
@@ -81,14 +93,14 @@ class SalesforceAuthOAuth(SalesforceAuth):
         try:
             LOGGER.info("Attempting login via OAuth2")
 
-            resp = requests.post(
+            resp = self._session.post(
                 self._login_url,
                 data=self._login_body,
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
             )
 
             resp.raise_for_status()
-            auth = resp.json()
+            auth = orjson.loads(resp.content)
 
             LOGGER.info("OAuth2 login successful")
             self._access_token = auth["access_token"]
@@ -100,7 +112,12 @@ class SalesforceAuthOAuth(SalesforceAuth):
             raise Exception(error_message) from e
         finally:
             LOGGER.info("Starting new login timer")
+            # Never leave two refresh timers running, and don't let a pending
+            # 15-minute timer delay interpreter shutdown
+            if self.login_timer:
+                self.login_timer.cancel()
             self.login_timer = threading.Timer(self.REFRESH_TOKEN_EXPIRATION_PERIOD, self.login)
+            self.login_timer.daemon = True
             self.login_timer.start()
 
 
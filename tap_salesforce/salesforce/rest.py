@@ -1,4 +1,7 @@
 # pylint: disable=protected-access
+import concurrent.futures
+
+import orjson
 import singer
 import singer.utils as singer_utils
 from requests.exceptions import HTTPError
@@ -80,15 +83,29 @@ class Rest:
                 yield record
 
     def _sync_records(self, url, headers, params):
-        while True:
+        # Download the next page in a background thread while the current
+        # page's records flow through the transform/emit pipeline
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
             resp = self.sf._make_request("GET", url, headers=headers, params=params)
-            resp_json = resp.json()
 
-            yield from resp_json.get("records")
+            while True:
+                resp_json = orjson.loads(resp.content)
+                next_records_url = resp_json.get("nextRecordsUrl")
 
-            next_records_url = resp_json.get("nextRecordsUrl")
+                next_page = None
+                if next_records_url is not None:
+                    # The cursor URL fully identifies the page; re-encoding
+                    # and re-sending the q parameter is wasted bytes and work
+                    next_page = pool.submit(
+                        self.sf._make_request,
+                        "GET",
+                        f"{self.sf.instance_url}{next_records_url}",
+                        headers=headers,
+                    )
 
-            if next_records_url is None:
-                break
-            else:
-                url = f"{self.sf.instance_url}{next_records_url}"
+                yield from resp_json.get("records")
+
+                if next_page is None:
+                    break
+
+                resp = next_page.result()
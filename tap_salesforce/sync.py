@@ -1,5 +1,6 @@
 import time
 
+import ciso8601
 import singer
 import singer.utils as singer_utils
 from requests.exceptions import RequestException
@@ -61,6 +62,7 @@ def resume_syncing_bulk_query(sf, catalog_entry, job_id, state, counter):
     replication_key = catalog_metadata.get((), {}).get("replication-key")
     stream_version = get_stream_version(catalog_entry, state)
     schema = catalog_entry["schema"]
+    anytype_fields = get_anytype_fields(schema)
 
     if not bulk.job_exists(job_id):
         LOGGER.info("Found stored Job ID that no longer exists, resetting bookmark and removing JobID from state.")
@@ -72,7 +74,7 @@ def resume_syncing_bulk_query(sf, catalog_entry, job_id, state, counter):
             for rec in bulk.get_batch_results(job_id, batch_id, catalog_entry):
                 counter.increment()
                 rec = transformer.transform(rec, schema)
-                rec = fix_record_anytype(rec, schema)
+                rec = fix_record_anytype(rec, anytype_fields)
                 singer.write_message(
                     singer.RecordMessage(
                         stream=(stream_alias or stream),
@@ -83,13 +85,13 @@ def resume_syncing_bulk_query(sf, catalog_entry, job_id, state, counter):
                 )
 
                 # Update bookmark if necessary
-                replication_key_value = replication_key and singer_utils.strptime_with_tz(rec[replication_key])
+                replication_key_value = replication_key and ciso8601.parse_datetime(rec[replication_key])
                 if (
                     replication_key_value
                     and replication_key_value <= start_time
                     and replication_key_value > current_bookmark
                 ):
-                    current_bookmark = singer_utils.strptime_with_tz(rec[replication_key])
+                    current_bookmark = ciso8601.parse_datetime(rec[replication_key])
 
         state = singer.write_bookmark(
             state,
@@ -121,6 +123,7 @@ def sync_records(sf, catalog_entry, state, counter, state_msg_threshold):
     chunked_bookmark = singer_utils.strptime_with_tz(sf.get_start_date(state, catalog_entry))
     stream = catalog_entry["stream"]
     schema = catalog_entry["schema"]
+    anytype_fields = get_anytype_fields(schema)
     stream_alias = catalog_entry.get("stream_alias")
     catalog_metadata = metadata.to_map(catalog_entry["metadata"])
     replication_key = catalog_metadata.get((), {}).get("replication-key")
@@ -131,51 +134,51 @@ def sync_records(sf, catalog_entry, state, counter, state_msg_threshold):
 
     LOGGER.info("Syncing Salesforce data for stream %s", stream)
 
-    for rec in sf.query(catalog_entry, state):
-        counter.increment()
-        with Transformer(pre_hook=transform_bulk_data_hook) as transformer:
+    with Transformer(pre_hook=transform_bulk_data_hook) as transformer:
+        for rec in sf.query(catalog_entry, state):
+            counter.increment()
             rec = transformer.transform(rec, schema)
-        rec = fix_record_anytype(rec, schema)
-        singer.write_message(
-            singer.RecordMessage(
-                stream=(stream_alias or stream),
-                record=rec,
-                version=stream_version,
-                time_extracted=start_time,
+            rec = fix_record_anytype(rec, anytype_fields)
+            singer.write_message(
+                singer.RecordMessage(
+                    stream=(stream_alias or stream),
+                    record=rec,
+                    version=stream_version,
+                    time_extracted=start_time,
+                )
             )
-        )
 
-        replication_key_value = replication_key and singer_utils.strptime_with_tz(rec[replication_key])
+            replication_key_value = replication_key and ciso8601.parse_datetime(rec[replication_key])
 
-        if sf.pk_chunking:
-            if (
-                replication_key_value
-                and replication_key_value <= start_time
-                and replication_key_value > chunked_bookmark
-            ):
-                # Replace the highest seen bookmark and save the state in case we need to resume later
-                chunked_bookmark = singer_utils.strptime_with_tz(rec[replication_key])
+            if sf.pk_chunking:
+                if (
+                    replication_key_value
+                    and replication_key_value <= start_time
+                    and replication_key_value > chunked_bookmark
+                ):
+                    # Replace the highest seen bookmark and save the state in case we need to resume later
+                    chunked_bookmark = ciso8601.parse_datetime(rec[replication_key])
+                    state = singer.write_bookmark(
+                        state,
+                        catalog_entry["tap_stream_id"],
+                        "JobHighestBookmarkSeen",
+                        singer_utils.strftime(chunked_bookmark),
+                    )
+
+                    if counter.value % state_msg_threshold == 0:
+                        singer.write_state(state)
+            # Before writing a bookmark, make sure Salesforce has not given us a
+            # record with one outside our range
+            elif replication_key_value and replication_key_value <= start_time:
                 state = singer.write_bookmark(
                     state,
                     catalog_entry["tap_stream_id"],
-                    "JobHighestBookmarkSeen",
-                    singer_utils.strftime(chunked_bookmark),
+                    replication_key,
+                    rec[replication_key],
                 )
 
                 if counter.value % state_msg_threshold == 0:
                     singer.write_state(state)
-        # Before writing a bookmark, make sure Salesforce has not given us a
-        # record with one outside our range
-        elif replication_key_value and replication_key_value <= start_time:
-            state = singer.write_bookmark(
-                state,
-                catalog_entry["tap_stream_id"],
-                replication_key,
-                rec[replication_key],
-            )
-
-            if counter.value % state_msg_threshold == 0:
-                singer.write_state(state)
 
     # Tables with no replication_key will send an
     # activate_version message for the next sync
@@ -194,27 +197,38 @@ def sync_records(sf, catalog_entry, state, counter, state_msg_threshold):
         )
 
 
-def fix_record_anytype(rec, schema):
-    """Modifies a record when the schema has no 'type' element due to a SF type of 'anyType.'
-    Attempts to set the record's value for that element to an int, float, or string."""
-
-    def try_cast(val, coercion):
-        try:
-            return coercion(val)
-        except BaseException:
-            return val
-
-    for k, v in rec.items():
-        if schema["properties"][k].get("type") is None:
-            val = v
-            val = try_cast(v, int)
-            val = try_cast(v, float)
-            if v in ["true", "false"]:
-                val = v == "true"
-
-            if v == "":
-                val = None
-
-            rec[k] = val
+def get_anytype_fields(schema):
+    """Returns the field names whose schema has no 'type' element due to a SF
+    type of 'anyType.' Computed once per stream so the per-record fix only
+    touches the fields that need coercion."""
+    return tuple(k for k, v in schema["properties"].items() if v.get("type") is None)
+
+
+def fix_record_anytype(rec, anytype_fields):
+    """Modifies a record's 'anyType' fields (precomputed via
+    `get_anytype_fields`). Attempts to set the record's value for that element
+    to an int, float, or string."""
+
+    for k in anytype_fields:
+        if k not in rec:
+            continue
+
+        v = rec[k]
+        if v == "":
+            val = None
+        elif v in ("true", "false"):
+            val = v == "true"
+        else:
+            # Prefer int over float so whole numbers keep their type; fall
+            # back to the original value when neither parse succeeds
+            try:
+                val = int(v)
+            except (TypeError, ValueError):
+                try:
+                    val = float(v)
+                except (TypeError, ValueError):
+                    val = v
+
+        rec[k] = val
 
     return rec